@@ -8,31 +8,161 @@ NZB Info Applications HTTP client with optimized 2-row display for all applicati
 import asyncio
 import json
 import logging
+import re
 import ssl
 import time
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from datetime import datetime, timedelta
 
 import aiohttp
 import certifi
+import orjson
+from yarl import URL
+
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
 
 from uc_intg_nzbinfo.config import NZBInfoConfig
 
 _LOG = logging.getLogger(__name__)
 
+_HEALTH_ENDPOINTS = {
+    "sabnzbd": "/api?mode=version",
+    "nzbget": "/jsonrpc",
+    "sonarr": "/api/v3/system/status",
+    "radarr": "/api/v3/system/status",
+    "lidarr": "/api/v1/system/status",
+    "readarr": "/api/v1/system/status",
+    "bazarr": "/api/system/status",
+    "overseerr": "/api/v1/status"
+}
+
+_PROBE_ENDPOINTS = {
+    **_HEALTH_ENDPOINTS,
+    "sonarr": "/ping",
+    "radarr": "/ping",
+    "lidarr": "/ping",
+    "readarr": "/ping"
+}
+
+_XAPI_KEY_APPS = frozenset({"sonarr", "radarr", "lidarr", "readarr", "overseerr"})
+
+_API_HEADER_OVERRIDES = {"bazarr": "X-API-KEY"}
+
+_PREFIX_RE = re.compile(
+    r'^(?:/tvshows/|/movies/|/downloads/|/media/'
+    r'|\\\\\\\\tvshows\\\\\\\\|\\\\\\\\movies\\\\\\\\|\\\\\\\\downloads\\\\\\\\|\\\\\\\\media\\\\\\\\'
+    r'|[CD]:\\\\\\\\|/home/|/mnt/)',
+    re.IGNORECASE
+)
+
+
+_SIZE_RE = re.compile(r'^\s*([\d.]+)\s*([KMGT]B?|B)\s*(?:/s)?\s*$', re.IGNORECASE)
+
+# Keyed on the unit's first letter so bare prefixes ("1.3 M") match too.
+_UNIT_MB = {'B': 1 / 1048576, 'K': 1 / 1024, 'M': 1.0, 'G': 1024.0, 'T': 1048576.0}
+
+_RECENT_TPL = "Recent: {}".format
+
+_DL_TPL = "Downloading: {name} @ {speed}{eta}".format
+
+# Upper bound on one full status refresh; a stuck backend should not be able
+# to block the UI past this, and it stays below the 10s session timeout.
+_STATUS_UPDATE_TIMEOUT = 8.0
+
+# Adaptive per-app poll cadence: apps whose payload did not change since
+# the last poll back off exponentially between these bounds. The floor
+# matches the monitoring loop's 5s active tick so changing apps are
+# re-fetched at full cadence.
+_POLL_TTL_MIN = 5.0
+_POLL_TTL_MAX = 300.0
+
+# Shared empty mapping for missing optional sub-objects; never mutated.
+_EMPTY_DICT: dict = {}
+
+
+@lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Build the shared relaxed SSL context once; CA bundle parsing is expensive."""
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
 
+
+@lru_cache(maxsize=2048)
+def _clean_file_path(file_path: str) -> str:
+    """Extract clean filename from full path."""
+    if not file_path:
+        return "Unknown"
+
+    clean_path = _PREFIX_RE.sub('', file_path, count=1)
+    return clean_path.rsplit('/', 1)[-1].rsplit('\\\\', 1)[-1]
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(date_str: str):
+    """Parse an ISO date/datetime string to a date, or None if malformed."""
+    try:
+        if 'T' in date_str:
+            return datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
+        return datetime.fromisoformat(date_str).date()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _smart_truncate(text: str, max_length: int = 35) -> str:
+    """Smart truncate filename keeping important parts."""
+    if len(text) <= max_length:
+        return text
+
+    if '.' in text:
+        name, ext = text.rsplit('.', 1)
+        if len(ext) <= 4:
+            available = max_length - len(ext) - 4
+            if available > 10:
+                return f"{name[:available]}...{ext}"
+
+    return f"{text[:max_length-3]}..."
+
+
+@dataclass(slots=True)
+class _AppEndpoints:
+    """Pre-resolved URLs and headers for one application."""
+
+    base_url: str
+    api_key: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    health_url: str = ""
+    probe_url: str = ""
+    queue_url: Optional[URL] = None
+    history_url: Optional[URL] = None
+    requests_url: Optional[URL] = None
+
+
+@dataclass(slots=True)
 class AppStatus:
     """Container for application status data."""
 
-    def __init__(self, app_name: str):
-        """Initialize status container."""
-        self.app_name = app_name
-        self.is_online = False
-        self.title = app_name.title()
-        self.primary_info = "Offline"
-        self.secondary_info = "Not connected"
-        self.last_updated = time.time()
-        self.raw_data = {}
+    app_name: str
+    is_online: bool = False
+    title: str = ""
+    primary_info: str = "Offline"
+    secondary_info: str = "Not connected"
+    last_updated: float = field(default_factory=time.time)
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Default the display title from the app name."""
+        if not self.title:
+            self.title = self.app_name.title()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
@@ -53,36 +183,65 @@ class NZBInfoClient:
     def __init__(self, config: NZBInfoConfig):
         """Initialize NZB Info client."""
         self._config = config
+        self._enabled_apps: tuple = tuple(config.get_enabled_apps())
         self._session: Optional[aiohttp.ClientSession] = None
         self._app_statuses: Dict[str, AppStatus] = {}
+        self._endpoints: Dict[str, _AppEndpoints] = {}
+        self._cache: Dict[str, tuple] = {}
+        self._update_semaphore = asyncio.Semaphore(4)
+        self._tick_time = time.time()
+        self._app_ttl: Dict[str, float] = {}
+        self._app_last_hash: Dict[str, int] = {}
+        self._app_next_due: Dict[str, float] = {}
         self._is_connected = False
 
+    def _ensure_session(self) -> None:
+        """Create the shared client session exactly once.
+
+        All app updaters go through this single session so every request
+        shares one connection pool and its keep-alives.
+        """
+        if self._session is not None and not self._session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            ssl=_get_ssl_context(),
+            limit=100,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            force_close=False,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None
+        )
+        timeout = aiohttp.ClientTimeout(total=10)
+        self._session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            trust_env=True,
+            json_serialize=lambda v: orjson.dumps(v).decode(),
+            headers={"Connection": "keep-alive", "Accept-Encoding": "gzip"}
+        )
+
     async def connect(self) -> bool:
         """Connect to enabled applications."""
         try:
-            if self._session is None:
-                ssl_context = ssl.create_default_context(cafile=certifi.where())
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                
-                connector = aiohttp.TCPConnector(ssl=ssl_context)
-                timeout = aiohttp.ClientTimeout(total=10)
-                self._session = aiohttp.ClientSession(
-                    timeout=timeout,
-                    connector=connector
-                )
-
-            for app_name in self._config.get_enabled_apps():
+            self._ensure_session()
+
+            for app_name in self._enabled_apps:
                 self._app_statuses[app_name] = AppStatus(app_name)
+                self._endpoints[app_name] = self._resolve_app_endpoints(app_name)
 
-            success_count = 0
-            for app_name in self._config.get_enabled_apps():
-                if await self._test_app_connection(app_name):
-                    success_count += 1
+            results = await asyncio.gather(
+                *[self._test_app_connection(app_name) for app_name in self._enabled_apps],
+                return_exceptions=True
+            )
+            success_count = sum(1 for result in results if result is True)
 
             self._is_connected = success_count > 0
             _LOG.info("Connected to %d/%d NZB Info applications", 
-                      success_count, len(self._config.get_enabled_apps()))
+                      success_count, len(self._enabled_apps))
             return self._is_connected
 
         except Exception as ex:
@@ -90,6 +249,21 @@ class NZBInfoClient:
             self._is_connected = False
             return False
 
+    def refresh_enabled_apps(self) -> None:
+        """Re-read the enabled-apps list after a configuration change.
+
+        Drops every per-app cache (statuses, resolved endpoints, response
+        cache, poll schedule) so removed apps disappear and the next
+        connect() resolves everything against the new configuration.
+        """
+        self._enabled_apps = tuple(self._config.get_enabled_apps())
+        self._app_statuses.clear()
+        self._endpoints.clear()
+        self._cache.clear()
+        self._app_ttl.clear()
+        self._app_last_hash.clear()
+        self._app_next_due.clear()
+
     async def disconnect(self) -> None:
         """Disconnect from applications."""
         if self._session:
@@ -98,6 +272,26 @@ class NZBInfoClient:
         self._is_connected = False
         _LOG.info("Disconnected from NZB Info applications")
 
+    def _resolve_app_endpoints(self, app_name: str) -> _AppEndpoints:
+        """Resolve base URL, API key, headers and hot-path URLs once per app."""
+        base_url, api_key = self._config.get_app_request_params(app_name)
+
+        endpoints = _AppEndpoints(
+            base_url=base_url,
+            api_key=api_key,
+            headers=self._get_auth_headers(app_name),
+            health_url=self._get_health_check_url(app_name),
+            probe_url=self._get_health_check_url(app_name, probe_only=True)
+        )
+
+        if app_name == "sabnzbd":
+            endpoints.queue_url = URL(f"{base_url}/api?mode=queue&apikey={api_key}&output=json")
+            endpoints.history_url = URL(f"{base_url}/api?mode=history&apikey={api_key}&output=json&limit=2&failed_only=0")
+        elif app_name == "overseerr":
+            endpoints.requests_url = URL(f"{base_url}/api/v1/request?take=5&sort=added")
+
+        return endpoints
+
     async def _test_app_connection(self, app_name: str) -> bool:
         """Test connection to specific application."""
         try:
@@ -105,41 +299,44 @@ class NZBInfoClient:
             if not app_config or "host" not in app_config:
                 return False
 
-            url = self._get_health_check_url(app_name)
+            endpoints = self._endpoints.get(app_name) or self._resolve_app_endpoints(app_name)
+            url = endpoints.probe_url or endpoints.health_url
             if not url:
                 return False
 
-            headers = self._get_auth_headers(app_name)
-            
-            async with self._session.get(url, headers=headers) as response:
-                if response.status in [200, 401]:
-                    self._app_statuses[app_name].is_online = True
-                    return True
-                    
+            headers = endpoints.headers
+
+            response = await self._session.head(url, headers=headers, allow_redirects=False)
+            status_code = response.status
+            response.release()
+
+            if status_code == 405:
+                response = await self._session.get(url, headers=headers)
+                status_code = response.status
+                response.release()
+
+            if status_code in [200, 401]:
+                self._app_statuses[app_name].is_online = True
+                return True
+
         except Exception as ex:
             _LOG.debug("Connection test failed for %s: %s", app_name, ex)
             
         self._app_statuses[app_name].is_online = False
         return False
 
-    def _get_health_check_url(self, app_name: str) -> str:
-        """Get health check URL for application."""
+    def _get_health_check_url(self, app_name: str, probe_only: bool = False) -> str:
+        """Get health check URL for application.
+
+        With probe_only, prefer minimal endpoints (e.g. /ping) that answer
+        reachability without serializing a full status payload.
+        """
         base_url = self._config.get_app_url(app_name)
         if not base_url:
             return ""
 
-        health_endpoints = {
-            "sabnzbd": "/api?mode=version",
-            "nzbget": "/jsonrpc",
-            "sonarr": "/api/v3/system/status", 
-            "radarr": "/api/v3/system/status",
-            "lidarr": "/api/v1/system/status",
-            "readarr": "/api/v1/system/status",
-            "bazarr": "/api/system/status",
-            "overseerr": "/api/v1/status"
-        }
-
-        endpoint = health_endpoints.get(app_name, "/")
+        endpoints = _PROBE_ENDPOINTS if probe_only else _HEALTH_ENDPOINTS
+        endpoint = endpoints.get(app_name, "/")
         url = f"{base_url}{endpoint}"
         
         if app_name == "sabnzbd":
@@ -156,50 +353,39 @@ class NZBInfoClient:
         api_key = self._config.get_app_api_key(app_name)
         
         if api_key:
-            if app_name == "bazarr":
-                headers["X-API-KEY"] = api_key
-            elif app_name in ["sonarr", "radarr", "lidarr", "readarr", "overseerr"]:
+            if app_name in _API_HEADER_OVERRIDES:
+                headers[_API_HEADER_OVERRIDES[app_name]] = api_key
+            elif app_name in _XAPI_KEY_APPS:
                 headers["X-Api-Key"] = api_key
-        
+
         return headers
 
-    def _clean_file_path(self, file_path: str) -> str:
-        """Extract clean filename from full path."""
-        if not file_path:
-            return "Unknown"
-        
-        path_prefixes_to_remove = [
-            "/tvshows/", "/movies/", "/downloads/", "/media/",
-            "\\\\tvshows\\\\", "\\\\movies\\\\", "\\\\downloads\\\\", "\\\\media\\\\",
-            "C:\\\\", "D:\\\\", "/home/", "/mnt/"
-        ]
-        
-        clean_path = file_path
-        for prefix in path_prefixes_to_remove:
-            if clean_path.lower().startswith(prefix.lower()):
-                clean_path = clean_path[len(prefix):]
-                break
-        
-        if '/' in clean_path:
-            clean_path = clean_path.split('/')[-1]
-        elif '\\\\' in clean_path:
-            clean_path = clean_path.split('\\\\')[-1]
-        
-        return clean_path
-
-    def _smart_truncate(self, text: str, max_length: int = 35) -> str:
-        """Smart truncate filename keeping important parts."""
-        if len(text) <= max_length:
-            return text
-        
-        if '.' in text:
-            name, ext = text.rsplit('.', 1)
-            if len(ext) <= 4:
-                available = max_length - len(ext) - 4
-                if available > 10:
-                    return f"{name[:available]}...{ext}"
-        
-        return f"{text[:max_length-3]}..."
+    async def _fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> tuple:
+        """GET a URL and return (status, parsed JSON or None)."""
+        async with self._session.get(url, headers=headers) as response:
+            if response.status == 200 and 'json' in response.content_type:
+                return response.status, orjson.loads(await response.read())
+            return response.status, None
+
+    async def _post_json(self, url: str, payload: Any) -> tuple:
+        """POST a JSON payload and return (status, parsed JSON or None)."""
+        async with self._session.post(url, json=payload) as response:
+            if response.status == 200 and 'json' in response.content_type:
+                return response.status, orjson.loads(await response.read())
+            return response.status, None
+
+    async def _cached_json(self, url: str, headers: Optional[Dict[str, str]] = None, ttl: float = 30.0) -> tuple:
+        """Like _fetch_json, but serves recent successful responses from a short-TTL cache."""
+        cached = self._cache.get(url)
+        if cached is not None and time.time() - cached[0] < ttl:
+            return cached[1]
+
+        result = await self._fetch_json(url, headers)
+        if result[0] == 200 and result[1] is not None:
+            if len(self._cache) > 64:
+                self._cache.clear()
+            self._cache[url] = (time.time(), result)
+        return result
 
     def _format_recent_files(self, files: List[str]) -> str:
         """Format up to 2 recent files with smart truncation and path cleaning."""
@@ -208,104 +394,92 @@ class NZBInfoClient:
         
         recent_files = []
         for file in files[:2]:
-            cleaned_file = self._clean_file_path(file)
-            truncated = self._smart_truncate(cleaned_file, 30)
+            cleaned_file = _clean_file_path(file)
+            truncated = _smart_truncate(cleaned_file, 30)
             recent_files.append(truncated)
-        
-        return f"Recent: {' | '.join(recent_files)}"
+
+        return _RECENT_TPL(" | ".join(recent_files))
 
     def _calculate_eta(self, size_left: str, speed: str) -> str:
         """Calculate ETA from size left and speed."""
-        try:
-            if not size_left or size_left == "0 B":
-                return ""
-            
-            if not speed or speed == "0" or "0 B/s" in speed:
-                return ""
-            
-            size_parts = size_left.split()
-            speed_parts = speed.split()
-            
-            if len(size_parts) != 2 or len(speed_parts) != 2:
-                return ""
-            
-            size_value = float(size_parts[0])
-            size_unit = size_parts[1].upper()
-            speed_value = float(speed_parts[0])
-            speed_unit = speed_parts[1].upper().replace("/S", "")
-            
-            size_mb = size_value
-            if size_unit.startswith("GB"):
-                size_mb = size_value * 1024
-            elif size_unit.startswith("KB"):
-                size_mb = size_value / 1024
-            
-            speed_mb = speed_value
-            if speed_unit.startswith("GB"):
-                speed_mb = speed_value * 1024
-            elif speed_unit.startswith("KB"):
-                speed_mb = speed_value / 1024
-            
-            if speed_mb <= 0:
-                return ""
-            
-            eta_minutes = size_mb / speed_mb / 60
-            
-            if eta_minutes < 1:
-                return " (<1m)"
-            elif eta_minutes < 60:
-                return f" ({eta_minutes:.0f}m)"
-            else:
-                hours = int(eta_minutes // 60)
-                minutes = int(eta_minutes % 60)
-                return f" ({hours}h{minutes:02d}m)"
-                
-        except Exception:
+        if not size_left or not speed:
+            return ""
+
+        size_match = _SIZE_RE.match(size_left)
+        speed_match = _SIZE_RE.match(speed)
+        if not size_match or not speed_match:
             return ""
 
+        size_mb = float(size_match.group(1)) * _UNIT_MB[size_match.group(2)[0].upper()]
+        speed_mb = float(speed_match.group(1)) * _UNIT_MB[speed_match.group(2)[0].upper()]
+
+        if size_mb <= 0 or speed_mb <= 0:
+            return ""
+
+        eta_minutes = size_mb / speed_mb / 60
+
+        if eta_minutes < 1:
+            return " (<1m)"
+        elif eta_minutes < 60:
+            return f" ({eta_minutes:.0f}m)"
+        else:
+            hours = int(eta_minutes // 60)
+            minutes = int(eta_minutes % 60)
+            return f" ({hours}h{minutes:02d}m)"
+
     def _format_upcoming_date(self, date_str: str) -> str:
         """Format upcoming date for display."""
-        try:
-            if 'T' in date_str:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            else:
-                date_obj = datetime.fromisoformat(date_str)
-            
-            now = datetime.now(date_obj.tzinfo) if date_obj.tzinfo else datetime.now()
-            
-            days_diff = (date_obj.date() - now.date()).days
-            
-            if days_diff == 0:
-                return "Today"
-            elif days_diff == 1:
-                return "Tomorrow"
-            elif days_diff < 7:
-                return f"{days_diff}d"
-            else:
-                return date_obj.strftime("%b %d")
-                
-        except Exception:
+        if not date_str or len(date_str) < 10 or '-' not in date_str:
             return "Unknown"
 
+        today = datetime.now().date()
+        if date_str.startswith(today.isoformat()):
+            return "Today"
+
+        date_obj = _parse_iso_date(date_str)
+        if date_obj is None:
+            return "Unknown"
+
+        days_diff = (date_obj - today).days
+
+        if days_diff == 0:
+            return "Today"
+        elif days_diff == 1:
+            return "Tomorrow"
+        elif days_diff < 7:
+            return f"{days_diff}d"
+        else:
+            return date_obj.strftime("%b %d")
+
     async def update_all_statuses(self) -> bool:
         """Update status for all enabled applications."""
         if not self._session:
             return False
 
-        success_count = 0
-        tasks = []
-        
-        for app_name in self._config.get_enabled_apps():
-            task = asyncio.create_task(self._update_app_status(app_name))
-            tasks.append(task)
+        # One wall-clock read per tick; every app stamped in this round
+        # shares it instead of issuing its own syscall.
+        self._tick_time = time.time()
+        tasks = [
+            asyncio.create_task(self._update_app_status(app_name))
+            for app_name in self._enabled_apps
+        ]
+        if not tasks:
+            return False
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, bool) and result:
-                success_count += 1
-            elif isinstance(result, Exception):
-                _LOG.error("Error updating app status: %s", result)
+        done, pending = await asyncio.wait(tasks, timeout=_STATUS_UPDATE_TIMEOUT)
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOG.warning("Status update timed out for %d of %d applications", len(pending), len(tasks))
+
+        success_count = 0
+        for task in done:
+            try:
+                if task.result() is True:
+                    success_count += 1
+            except Exception as ex:
+                _LOG.error("Error updating app status: %s", ex)
 
         return success_count > 0
 
@@ -316,23 +490,17 @@ class NZBInfoClient:
             if not status:
                 return False
 
-            app_config = self._config.get_app_config(app_name)
-            if not app_config or "host" not in app_config:
-                status.is_online = False
-                status.primary_info = "Not configured"
-                status.secondary_info = "Missing configuration"
-                return False
+            now = time.monotonic()
+            if now < self._app_next_due.get(app_name, 0.0) and status.is_online:
+                # Payload was stable on recent polls; keep the cached
+                # status until this app's backed-off TTL expires.
+                return True
+
+            async with self._update_semaphore:
+                result = await self._dispatch_app_update(app_name, status)
 
-            if app_name == "sabnzbd":
-                return await self._update_sabnzbd_2row(status)
-            elif app_name == "nzbget":
-                return await self._update_nzbget_2row(status)
-            elif app_name in ["sonarr", "radarr", "lidarr", "readarr"]:
-                return await self._update_media_manager_2row(status)
-            elif app_name == "bazarr":
-                return await self._update_bazarr_2row(status)
-            elif app_name == "overseerr":
-                return await self._update_overseerr_2row(status)
+            self._schedule_next_poll(app_name, status, result)
+            return result
 
         except Exception as ex:
             _LOG.error("Failed to update %s status: %s", app_name, ex)
@@ -340,61 +508,121 @@ class NZBInfoClient:
                 self._app_statuses[app_name].is_online = False
                 self._app_statuses[app_name].primary_info = "Connection Error"
                 self._app_statuses[app_name].secondary_info = str(ex)[:50]
+            self._app_next_due.pop(app_name, None)
+            return False
+
+    def _schedule_next_poll(self, app_name: str, status: AppStatus, result: bool) -> None:
+        """Back the poll cadence off while an app's payload is unchanged.
+
+        A changed (or failed) payload leaves the app due immediately, so
+        the next monitoring tick re-fetches it at full cadence; every
+        unchanged poll doubles the TTL up to the cap, so idle apps cost
+        a fraction of the HTTP round-trips of active ones.
+        """
+        if not result:
+            self._app_ttl[app_name] = _POLL_TTL_MIN
+            self._app_next_due.pop(app_name, None)
+            return
+
+        # Hash the displayed fields too: some updaters (media managers,
+        # Bazarr) keep raw_data sparse, and raw_data alone would look
+        # unchanged while the visible rows are actively updating.
+        try:
+            payload_hash = hash(orjson.dumps(
+                [status.primary_info, status.secondary_info, status.raw_data],
+                option=orjson.OPT_SORT_KEYS,
+            ))
+        except (TypeError, orjson.JSONEncodeError):
+            payload_hash = None
+
+        if payload_hash is not None and payload_hash == self._app_last_hash.get(app_name):
+            ttl = min(self._app_ttl.get(app_name, _POLL_TTL_MIN) * 2, _POLL_TTL_MAX)
+            self._app_next_due[app_name] = time.monotonic() + ttl
+        else:
+            # Changed payload: no gate, let every tick through until the
+            # app goes quiet again.
+            ttl = _POLL_TTL_MIN
+            self._app_next_due.pop(app_name, None)
+
+        self._app_last_hash[app_name] = payload_hash
+        self._app_ttl[app_name] = ttl
+
+    async def _dispatch_app_update(self, app_name: str, status: AppStatus) -> bool:
+        """Run the app-specific status updater."""
+        app_config = self._config.get_app_config(app_name)
+        if not app_config or "host" not in app_config:
+            status.is_online = False
+            status.primary_info = "Not configured"
+            status.secondary_info = "Missing configuration"
             return False
 
+        if app_name == "sabnzbd":
+            return await self._update_sabnzbd_2row(status)
+        elif app_name == "nzbget":
+            return await self._update_nzbget_2row(status)
+        elif app_name in ["sonarr", "radarr", "lidarr", "readarr"]:
+            return await self._update_media_manager_2row(status)
+        elif app_name == "bazarr":
+            return await self._update_bazarr_2row(status)
+        elif app_name == "overseerr":
+            return await self._update_overseerr_2row(status)
+
+        return False
+
     async def _update_sabnzbd_2row(self, status: AppStatus) -> bool:
         """2-row SABnzbd: Row1=Active download+speed+ETA, Row2=Recent files."""
-        base_url = self._config.get_app_url(status.app_name)
-        api_key = self._config.get_app_api_key(status.app_name)
-        
-        queue_url = f"{base_url}/api?mode=queue&apikey={api_key}&output=json"
-        history_url = f"{base_url}/api?mode=history&apikey={api_key}&output=json&limit=2"
-        
+        endpoints = self._endpoints[status.app_name]
+        queue_url = endpoints.queue_url
+        history_url = endpoints.history_url
+
         try:
-            async with self._session.get(queue_url) as response:
-                if response.status == 200:
-                    queue_data = await response.json()
-                    queue = queue_data.get("queue", {})
-                    
-                    active_jobs = queue.get("slots", [])
-                    speed = queue.get("speed", "0 B/s")
-                    size_left = queue.get("sizeleft", "0 B")
-                    
-                    status.is_online = True
-                    status.title = "SABnzbd"
-                    
-                    if active_jobs:
-                        current_job = active_jobs[0]
-                        filename = current_job.get("filename", "Unknown")
-                        
-                        display_name = self._smart_truncate(filename, 20)
-                        eta = self._calculate_eta(size_left, speed)
-                        
-                        status.primary_info = f"Downloading: {display_name} @ {speed}{eta}"
-                    else:
-                        status.primary_info = "Queue idle"
-                    
-                    try:
-                        async with self._session.get(history_url) as hist_response:
-                            if hist_response.status == 200:
-                                hist_data = await hist_response.json()
-                                slots = hist_data.get("history", {}).get("slots", [])
-                                
-                                recent_files = [slot.get("name", "Unknown") for slot in slots]
-                                status.secondary_info = self._format_recent_files(recent_files)
-                            else:
-                                status.secondary_info = "No recent activity"
-                    except Exception:
-                        status.secondary_info = "No recent activity"
-                    
-                    status.raw_data = {"queue_count": len(active_jobs), "speed": speed}
-                    status.last_updated = time.time()
-                    return True
+            queue_result, hist_result = await asyncio.gather(
+                self._fetch_json(queue_url),
+                self._cached_json(history_url, ttl=15),
+                return_exceptions=True
+            )
+
+            if isinstance(queue_result, Exception):
+                raise queue_result
+
+            queue_status, queue_data = queue_result
+            if queue_status == 200 and queue_data is not None:
+                queue = queue_data.get("queue", {})
+
+                active_jobs = queue.get("slots", [])
+                speed = queue.get("speed", "0 B/s")
+                size_left = queue.get("sizeleft", "0 B")
+
+                status.is_online = True
+                status.title = "SABnzbd"
+
+                if active_jobs:
+                    current_job = active_jobs[0]
+                    filename = current_job.get("filename", "Unknown")
+
+                    display_name = _smart_truncate(filename, 20)
+                    eta = self._calculate_eta(size_left, speed)
+
+                    status.primary_info = _DL_TPL(name=display_name, speed=speed, eta=eta)
                 else:
-                    status.is_online = False
-                    status.primary_info = "API Error"
-                    status.secondary_info = f"HTTP {response.status}"
-                    
+                    status.primary_info = "Queue idle"
+
+                if not isinstance(hist_result, Exception) and hist_result[0] == 200 and hist_result[1] is not None:
+                    slots = hist_result[1].get("history", {}).get("slots", [])
+
+                    recent_files = [slot.get("name", "Unknown") for slot in slots]
+                    status.secondary_info = self._format_recent_files(recent_files)
+                else:
+                    status.secondary_info = "No recent activity"
+
+                status.raw_data = {"queue_count": len(active_jobs), "speed": speed}
+                status.last_updated = self._tick_time
+                return True
+            else:
+                status.is_online = False
+                status.primary_info = "API Error"
+                status.secondary_info = f"HTTP {queue_status}"
+
         except Exception as ex:
             _LOG.error("SABnzbd status update failed: %s", ex)
             status.is_online = False
@@ -405,61 +633,59 @@ class NZBInfoClient:
 
     async def _update_nzbget_2row(self, status: AppStatus) -> bool:
         """2-row NZBget: Row1=Active download+speed, Row2=Recent files."""
-        base_url = self._config.get_app_url(status.app_name)
-        
+        base_url = self._endpoints[status.app_name].base_url
+
         try:
-            status_payload = {"method": "status", "params": [], "id": 1}
-            async with self._session.post(f"{base_url}/jsonrpc", json=status_payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    result = data.get("result", {})
-                    
-                    download_rate = result.get("DownloadRate", 0)
-                    remaining_size = result.get("RemainingSizeMB", 0)
-                    
-                    status.is_online = True
-                    status.title = "NZBget"
-                    
-                    if download_rate > 0:
-                        speed_mb = download_rate / 1024 / 1024
-                        
-                        if remaining_size > 0 and speed_mb > 0:
-                            eta_minutes = remaining_size / speed_mb / 60
-                            if eta_minutes < 60:
-                                eta = f" ({eta_minutes:.0f}m)"
-                            else:
-                                hours = int(eta_minutes // 60)
-                                minutes = int(eta_minutes % 60)
-                                eta = f" ({hours}h{minutes:02d}m)"
+            payload = [
+                {"method": "status", "params": [], "id": 1},
+                {"method": "history", "params": [], "id": 2}
+            ]
+            http_status, data = await self._post_json(f"{base_url}/jsonrpc", payload)
+
+            if http_status == 200 and data is not None:
+                responses = data if isinstance(data, list) else [data]
+                by_id = {item.get("id"): item for item in responses if isinstance(item, dict)}
+                result = by_id.get(1, {}).get("result", {})
+
+                download_rate = result.get("DownloadRate", 0)
+                remaining_size = result.get("RemainingSizeMB", 0)
+
+                status.is_online = True
+                status.title = "NZBget"
+
+                if download_rate > 0:
+                    speed_mb = download_rate / 1024 / 1024
+
+                    if remaining_size > 0 and speed_mb > 0:
+                        eta_minutes = remaining_size / speed_mb / 60
+                        if eta_minutes < 60:
+                            eta = f" ({eta_minutes:.0f}m)"
                         else:
-                            eta = ""
-                        
-                        status.primary_info = f"Downloading @ {speed_mb:.1f} MB/s{eta}"
+                            hours = int(eta_minutes // 60)
+                            minutes = int(eta_minutes % 60)
+                            eta = f" ({hours}h{minutes:02d}m)"
                     else:
-                        status.primary_info = "Queue idle"
-                    
-                    try:
-                        history_payload = {"method": "history", "params": [], "id": 2}
-                        async with self._session.post(f"{base_url}/jsonrpc", json=history_payload) as hist_response:
-                            if hist_response.status == 200:
-                                hist_data = await hist_response.json()
-                                history = hist_data.get("result", [])
-                                
-                                recent_files = [item.get("Name", "Unknown") for item in history[:2]]
-                                status.secondary_info = self._format_recent_files(recent_files)
-                            else:
-                                status.secondary_info = "No recent activity"
-                    except Exception:
-                        status.secondary_info = "No recent activity"
-                    
-                    status.raw_data = {"download_rate": download_rate, "remaining_mb": remaining_size}
-                    status.last_updated = time.time()
-                    return True
+                        eta = ""
+
+                    status.primary_info = f"Downloading @ {speed_mb:.1f} MB/s{eta}"
                 else:
-                    status.is_online = False
-                    status.primary_info = "API Error"
-                    status.secondary_info = f"HTTP {response.status}"
-                    
+                    status.primary_info = "Queue idle"
+
+                history = by_id.get(2, {}).get("result", [])
+                if history:
+                    recent_files = [item.get("Name", "Unknown") for item in history[:2]]
+                    status.secondary_info = self._format_recent_files(recent_files)
+                else:
+                    status.secondary_info = "No recent activity"
+
+                status.raw_data = {"download_rate": download_rate, "remaining_mb": remaining_size}
+                status.last_updated = self._tick_time
+                return True
+            else:
+                status.is_online = False
+                status.primary_info = "API Error"
+                status.secondary_info = f"HTTP {http_status}"
+
         except Exception as ex:
             _LOG.error("NZBget status update failed: %s", ex)
             status.is_online = False
@@ -470,20 +696,22 @@ class NZBInfoClient:
 
     async def _update_media_manager_2row(self, status: AppStatus) -> bool:
         """2-row media manager: Row1=Upcoming content, Row2=Recent files."""
-        base_url = self._config.get_app_url(status.app_name)
-        api_key = self._config.get_app_api_key(status.app_name)
-        
+        endpoints = self._endpoints[status.app_name]
+        base_url = endpoints.base_url
+        headers = endpoints.headers
+
         api_version = "v3" if status.app_name in ["sonarr", "radarr"] else "v1"
-        headers = {"X-Api-Key": api_key}
-        
+
         try:
             status.is_online = True
             status.title = status.app_name.title()
             
-            await self._get_upcoming_content(status, base_url, api_version, headers)
-            await self._get_recent_activity(status, base_url, api_version, headers)
+            await asyncio.gather(
+                self._get_upcoming_content(status, base_url, api_version, headers),
+                self._get_recent_activity(status, base_url, api_version, headers)
+            )
             
-            status.last_updated = time.time()
+            status.last_updated = self._tick_time
             return True
             
         except Exception as ex:
@@ -499,129 +727,127 @@ class NZBInfoClient:
         today = datetime.now().strftime("%Y-%m-%d")
         next_week = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
         
-        calendar_url = f"{base_url}/api/{api_version}/calendar?start={today}&end={next_week}&includeEpisode=true&includeSeries=true"
+        calendar_url = f"{base_url}/api/{api_version}/calendar?start={today}&end={next_week}&includeEpisode=true&includeSeries=true&unmonitored=false"
         
         try:
-            async with self._session.get(calendar_url, headers=headers) as response:
-                if response.status == 200:
-                    calendar_data = await response.json()
-                    
-                    if isinstance(calendar_data, list) and calendar_data:
-                        upcoming = None
-                        for item in calendar_data:
-                            if item.get("monitored", False) and not item.get("hasFile", False):
-                                upcoming = item
-                                break
-                        
-                        if upcoming:
-                            if status.app_name == "sonarr":
-                                series = upcoming.get('series', {})
-                                series_title = (series.get('title') or 
-                                                series.get('seriesTitle') or 
-                                                upcoming.get('seriesTitle') or
-                                                upcoming.get('seriesName') or
-                                                'Unknown Series')
-                                
-                                if series_title == 'Unknown Series' and 'episodeFile' in upcoming:
-                                    file_path = upcoming.get('episodeFile', {}).get('path', '')
-                                    if file_path:
-                                        path_parts = file_path.split('/')
-                                        if len(path_parts) >= 3:
-                                            series_title = path_parts[-3]
-                                
-                                season = upcoming.get('seasonNumber', 0)
-                                episode = upcoming.get('episodeNumber', 0)
-                                air_date = self._format_upcoming_date(upcoming.get('airDate', ''))
-                                
-                                title = self._smart_truncate(f"{series_title} S{season:02d}E{episode:02d}", 25)
-                                status.primary_info = f"Next: {title} ({air_date})"
-                                
-                            elif status.app_name == "radarr":
-                                movie_title = upcoming.get('title', 'Unknown')
-                                year = upcoming.get('year', '')
-                                release_date = self._format_upcoming_date(upcoming.get('inCinemas', ''))
-                                
-                                title = self._smart_truncate(f"{movie_title} ({year})", 25)
-                                status.primary_info = f"Next: {title} ({release_date})"
-                                
-                            elif status.app_name == "lidarr":
-                                artist = upcoming.get('artist', {}).get('artistName', 'Unknown Artist')
-                                album_title = upcoming.get('title', 'Unknown Album')
-                                release_date = self._format_upcoming_date(upcoming.get('releaseDate', ''))
-                                
-                                title = self._smart_truncate(f"{artist} - {album_title}", 25)
-                                status.primary_info = f"Next: {title} ({release_date})"
-                                
-                            elif status.app_name == "readarr":
-                                author = upcoming.get('author', {}).get('authorName', 'Unknown Author')
-                                book_title = upcoming.get('title', 'Unknown Book')
-                                release_date = self._format_upcoming_date(upcoming.get('releaseDate', ''))
-                                
-                                title = self._smart_truncate(f"{author} - {book_title}", 25)
-                                status.primary_info = f"Next: {title} ({release_date})"
-                        else:
-                            status.primary_info = "No upcoming releases"
+            resp_status, calendar_data = await self._cached_json(calendar_url, headers, ttl=60)
+            if resp_status == 200 and calendar_data is not None:
+                if isinstance(calendar_data, list) and calendar_data:
+                    upcoming = None
+                    for item in calendar_data:
+                        if item.get("monitored", False) and not item.get("hasFile", False):
+                            upcoming = item
+                            break
+
+                    if upcoming:
+                        if status.app_name == "sonarr":
+                            series = upcoming.get('series', {})
+                            series_title = (series.get('title') or
+                                            series.get('seriesTitle') or
+                                            upcoming.get('seriesTitle') or
+                                            upcoming.get('seriesName') or
+                                            'Unknown Series')
+
+                            if series_title == 'Unknown Series' and 'episodeFile' in upcoming:
+                                file_path = upcoming.get('episodeFile', {}).get('path', '')
+                                if file_path:
+                                    path_parts = file_path.split('/')
+                                    if len(path_parts) >= 3:
+                                        series_title = path_parts[-3]
+
+                            season = upcoming.get('seasonNumber', 0)
+                            episode = upcoming.get('episodeNumber', 0)
+                            air_date = self._format_upcoming_date(upcoming.get('airDate', ''))
+
+                            title = _smart_truncate(f"{series_title} S{season:02d}E{episode:02d}", 25)
+                            status.primary_info = f"Next: {title} ({air_date})"
+
+                        elif status.app_name == "radarr":
+                            movie_title = upcoming.get('title', 'Unknown')
+                            year = upcoming.get('year', '')
+                            release_date = self._format_upcoming_date(upcoming.get('inCinemas', ''))
+
+                            title = _smart_truncate(f"{movie_title} ({year})", 25)
+                            status.primary_info = f"Next: {title} ({release_date})"
+
+                        elif status.app_name == "lidarr":
+                            artist = upcoming.get('artist', {}).get('artistName', 'Unknown Artist')
+                            album_title = upcoming.get('title', 'Unknown Album')
+                            release_date = self._format_upcoming_date(upcoming.get('releaseDate', ''))
+
+                            title = _smart_truncate(f"{artist} - {album_title}", 25)
+                            status.primary_info = f"Next: {title} ({release_date})"
+
+                        elif status.app_name == "readarr":
+                            author = upcoming.get('author', {}).get('authorName', 'Unknown Author')
+                            book_title = upcoming.get('title', 'Unknown Book')
+                            release_date = self._format_upcoming_date(upcoming.get('releaseDate', ''))
+
+                            title = _smart_truncate(f"{author} - {book_title}", 25)
+                            status.primary_info = f"Next: {title} ({release_date})"
                     else:
                         status.primary_info = "No upcoming releases"
                 else:
-                    status.primary_info = "Calendar unavailable"
+                    status.primary_info = "No upcoming releases"
+            else:
+                status.primary_info = "Calendar unavailable"
         except Exception as e:
-            _LOG.debug(f"Calendar fetch failed for {status.app_name}: {e}")
+            _LOG.debug("Calendar fetch failed for %s: %s", status.app_name, e)
             status.primary_info = "No upcoming data"
 
     async def _get_recent_activity(self, status: AppStatus, base_url: str, api_version: str, headers: Dict[str, str]):
         """Get recent activity from history."""
-        history_url = f"{base_url}/api/{api_version}/history?pageSize=2"
+        history_url = f"{base_url}/api/{api_version}/history?pageSize=2&includeEpisode=false&includeSeries=false"
         try:
-            async with self._session.get(history_url, headers=headers) as response:
-                if response.status == 200:
-                    hist_data = await response.json()
-                    
-                    records = []
-                    if isinstance(hist_data, dict) and "records" in hist_data:
-                        records = hist_data.get("records", [])
-                    
-                    if records:
-                        recent_files = []
-                        for record in records[:2]:
-                            source = record.get('sourceTitle', 'Unknown')
-                            if source and source != 'Unknown':
-                                cleaned_source = self._clean_file_path(source)
-                                recent_files.append(cleaned_source)
-                        
-                        status.secondary_info = self._format_recent_files(recent_files)
-                    else:
-                        status.secondary_info = "No recent activity"
+            resp_status, hist_data = await self._cached_json(history_url, headers, ttl=30)
+            if resp_status == 200 and hist_data is not None:
+                records = []
+                if isinstance(hist_data, dict) and "records" in hist_data:
+                    records = hist_data.get("records", [])
+
+                if records:
+                    recent_files = []
+                    for record in records[:2]:
+                        source = record.get('sourceTitle', 'Unknown')
+                        if source and source != 'Unknown':
+                            cleaned_source = _clean_file_path(source)
+                            recent_files.append(cleaned_source)
+
+                    status.secondary_info = self._format_recent_files(recent_files)
                 else:
-                    status.secondary_info = "History unavailable"
+                    status.secondary_info = "No recent activity"
+            else:
+                status.secondary_info = "History unavailable"
         except Exception as e:
-            _LOG.debug(f"History fetch failed for {status.app_name}: {e}")
+            _LOG.debug("History fetch failed for %s: %s", status.app_name, e)
             status.secondary_info = "No recent activity"
 
     async def _update_bazarr_2row(self, status: AppStatus) -> bool:
         """2-row Bazarr: Row1=Subtitle activity, Row2=Recent downloads."""
-        base_url = self._config.get_app_url(status.app_name)
-        api_key = self._config.get_app_api_key(status.app_name)
-        
-        headers = {"X-API-KEY": api_key}
-        
+        endpoints = self._endpoints[status.app_name]
+        base_url = endpoints.base_url
+        headers = endpoints.headers
+
         status.is_online = True
         status.title = "Bazarr"
         
         try:
             test_url = f"{base_url}/api/system/status"
-            async with self._session.get(test_url, headers=headers) as response:
-                if response.status != 200:
-                    status.is_online = False
-                    status.primary_info = "Connection Error"
-                    status.secondary_info = f"HTTP {response.status}"
-                    return False
-                    
-                content_type = response.headers.get('content-type', '')
-                if 'text/html' in content_type:
-                    status.primary_info = "Authentication Error"
-                    status.secondary_info = "Check API key configuration"
-                    return False
+            response = await self._session.get(test_url, headers=headers)
+            status_code = response.status
+            content_type = response.headers.get('content-type', '')
+            response.release()
+
+            if status_code != 200:
+                status.is_online = False
+                status.primary_info = "Connection Error"
+                status.secondary_info = f"HTTP {status_code}"
+                return False
+
+            if 'text/html' in content_type:
+                status.primary_info = "Authentication Error"
+                status.secondary_info = "Check API key configuration"
+                return False
         except Exception as e:
             status.is_online = False
             status.primary_info = "Connection Error" 
@@ -631,44 +857,42 @@ class NZBInfoClient:
         recent_downloads = []
         
         try:
-            episodes_url = f"{base_url}/api/episodes/history?length=3"
-            async with self._session.get(episodes_url, headers=headers) as response:
-                if response.status == 200:
-                    episodes_data = await response.json()
-                    episodes_list = episodes_data.get("data", [])
-                    
-                    for item in episodes_list:
-                        series_title = item.get("seriesTitle", "Unknown")
-                        language = item.get("language", "")
-                        if language:
-                            file_info = f"{series_title} ({language})"
-                        else:
-                            file_info = series_title
-                        recent_downloads.append(file_info)
+            episodes_url = f"{base_url}/api/episodes/history?length=2"
+            resp_status, episodes_data = await self._cached_json(episodes_url, headers, ttl=30)
+            if resp_status == 200 and episodes_data is not None:
+                episodes_list = episodes_data.get("data", [])
+
+                for item in episodes_list:
+                    series_title = item.get("seriesTitle", "Unknown")
+                    language = item.get("language", "")
+                    if language:
+                        file_info = f"{series_title} ({language})"
+                    else:
+                        file_info = series_title
+                    recent_downloads.append(file_info)
         except Exception as e:
-            _LOG.debug(f"Bazarr episodes history failed: {e}")
+            _LOG.debug("Bazarr episodes history failed: %s", e)
         
         if len(recent_downloads) < 2:
             try:
-                movies_url = f"{base_url}/api/movies/history?length=3"
-                async with self._session.get(movies_url, headers=headers) as response:
-                    if response.status == 200:
-                        movies_data = await response.json()
-                        movies_list = movies_data.get("data", [])
-                        
-                        for item in movies_list:
-                            movie_title = item.get("title", "Unknown")
-                            language = item.get("language", "")
-                            if language:
-                                file_info = f"{movie_title} ({language})"
-                            else:
-                                file_info = movie_title
-                            recent_downloads.append(file_info)
-                            
-                            if len(recent_downloads) >= 2:
-                                break
+                movies_url = f"{base_url}/api/movies/history?length=2"
+                resp_status, movies_data = await self._cached_json(movies_url, headers, ttl=30)
+                if resp_status == 200 and movies_data is not None:
+                    movies_list = movies_data.get("data", [])
+
+                    for item in movies_list:
+                        movie_title = item.get("title", "Unknown")
+                        language = item.get("language", "")
+                        if language:
+                            file_info = f"{movie_title} ({language})"
+                        else:
+                            file_info = movie_title
+                        recent_downloads.append(file_info)
+
+                        if len(recent_downloads) >= 2:
+                            break
             except Exception as e:
-                _LOG.debug(f"Bazarr movies history failed: {e}")
+                _LOG.debug("Bazarr movies history failed: %s", e)
         
         if recent_downloads:
             status.primary_info = "Subtitle downloads active"
@@ -678,49 +902,47 @@ class NZBInfoClient:
         status.secondary_info = self._format_recent_files(recent_downloads) if recent_downloads else "No recent downloads"
         
         status.raw_data = {"recent_count": len(recent_downloads)}
-        status.last_updated = time.time()
+        status.last_updated = self._tick_time
         return True
 
     async def _update_overseerr_2row(self, status: AppStatus) -> bool:
         """2-row Overseerr: Row1=Pending requests, Row2=Recent requests."""
-        base_url = self._config.get_app_url(status.app_name)
-        api_key = self._config.get_app_api_key(status.app_name)
-        
-        headers = {"X-API-Key": api_key}
-        requests_url = f"{base_url}/api/v1/request?take=5&sort=added"
+        endpoints = self._endpoints[status.app_name]
+        headers = endpoints.headers
+        requests_url = endpoints.requests_url or URL(f"{endpoints.base_url}/api/v1/request?take=5&sort=added")
         
         try:
             async with self._session.get(requests_url, headers=headers) as response:
                 if response.status == 200:
-                    requests_data = await response.json()
+                    requests_data = orjson.loads(await response.read())
                     
                     status.is_online = True
                     status.title = "Overseerr"
                     
                     all_requests = requests_data.get("results", [])
-                    pending_requests = [r for r in all_requests if r.get("status") == 1]
-                    
-                    if pending_requests:
-                        status.primary_info = f"{len(pending_requests)} pending requests"
+                    pending_count = sum(1 for r in all_requests if r.get("status") == 1)
+
+                    if pending_count:
+                        status.primary_info = f"{pending_count} pending requests"
                     else:
                         status.primary_info = "No pending requests"
                     
                     if all_requests:
                         recent_files = []
                         for request in all_requests[:2]:
+                            media = request.get('media') or _EMPTY_DICT
                             if request.get("type") == "movie":
-                                media = request.get('media', {})
-                                title = f"{media.get('title', 'Unknown')} ({media.get('releaseDate', '')[:4]})"
+                                title = f"{media.get('title', 'Unknown')} ({(media.get('releaseDate') or '')[:4]})"
                             else:
-                                title = request.get('media', {}).get('name', 'Unknown')
+                                title = media.get('name', 'Unknown')
                             recent_files.append(title)
                         
                         status.secondary_info = self._format_recent_files(recent_files)
                     else:
                         status.secondary_info = "No recent requests"
                     
-                    status.raw_data = {"pending_count": len(pending_requests)}
-                    status.last_updated = time.time()
+                    status.raw_data = {"pending_count": pending_count}
+                    status.last_updated = self._tick_time
                     return True
                 else:
                     status.is_online = False
@@ -739,9 +961,9 @@ class NZBInfoClient:
         """Get status for specific application."""
         return self._app_statuses.get(app_name)
 
-    def get_all_statuses(self) -> Dict[str, AppStatus]:
-        """Get all application statuses."""
-        return self._app_statuses.copy()
+    def get_all_statuses(self) -> Mapping[str, AppStatus]:
+        """Get a read-only view of all application statuses."""
+        return MappingProxyType(self._app_statuses)
 
     @property
     def is_connected(self) -> bool:
@@ -751,4 +973,4 @@ class NZBInfoClient:
     @property
     def enabled_apps(self) -> List[str]:
         """Get list of enabled applications."""
-        return self._config.get_enabled_apps()
\ No newline at end of file
+        return list(self._enabled_apps)
\ No newline at end of file
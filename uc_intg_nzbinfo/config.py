@@ -10,6 +10,22 @@ import logging
 import os
 from typing import Any, Dict, List
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 _LOG = logging.getLogger(__name__)
 
 
@@ -39,15 +55,18 @@ class NZBInfoConfig:
         self._config_dir = config_dir
         self._config_file = os.path.join(config_dir, "config.json")
         self._config: Dict[str, Any] = {}
+        self._resolved: Dict[str, tuple] = {}
+        self._mtime_ns = 0
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from file."""
         try:
             if os.path.exists(self._config_file):
-                with open(self._config_file, "r", encoding="utf-8") as file:
-                    self._config = json.load(file)
+                with open(self._config_file, "rb") as file:
+                    self._config = _loads(file.read())
                     _LOG.info("Configuration loaded from %s", self._config_file)
+                self._mtime_ns = os.stat(self._config_file).st_mtime_ns
             else:
                 _LOG.info("No configuration file found, using defaults")
                 self._config = self._default_config()
@@ -55,25 +74,38 @@ class NZBInfoConfig:
             _LOG.error("Failed to load configuration: %s", ex)
             self._config = self._default_config()
 
+    def reload_if_changed(self) -> bool:
+        """Re-read the config file only if it changed on disk.
+
+        Returns True when a reload actually happened, so frequent
+        reconnects cost a single stat() instead of a full JSON parse.
+        """
+        try:
+            st = os.stat(self._config_file)
+        except OSError:
+            return False
+
+        if st.st_mtime_ns == self._mtime_ns:
+            return False
+
+        self._load_config()
+        self._resolved.clear()
+        return True
+
     def save_config(self) -> bool:
         """Save configuration to file."""
         try:
             os.makedirs(self._config_dir, exist_ok=True)
-            
-            test_file = os.path.join(self._config_dir, ".write_test")
-            try:
-                with open(test_file, "w") as f:
-                    f.write("test")
-                os.remove(test_file)
-            except (OSError, IOError) as e:
-                _LOG.error("Config directory not writable (%s): %s", self._config_dir, e)
-                return False
-            
-            with open(self._config_file, "w", encoding="utf-8") as file:
-                json.dump(self._config, file, indent=2)
+
+            tmp_file = self._config_file + ".tmp"
+            with open(tmp_file, "wb") as file:
+                file.write(_dumps(self._config))
+            os.replace(tmp_file, self._config_file)
+
+            self._mtime_ns = os.stat(self._config_file).st_mtime_ns
             _LOG.info("Configuration saved to %s", self._config_file)
             return True
-        except Exception as ex:
+        except OSError as ex:
             _LOG.error("Failed to save configuration to %s: %s", self._config_file, ex)
             return False
 
@@ -87,6 +119,7 @@ class NZBInfoConfig:
     def update_config(self, new_config: Dict[str, Any]) -> None:
         """Update configuration with new values."""
         self._config.update(new_config)
+        self._resolved.clear()
 
     def get_enabled_apps(self) -> List[str]:
         """Get list of enabled applications."""
@@ -105,9 +138,19 @@ class NZBInfoConfig:
         if "applications" not in self._config:
             self._config["applications"] = {}
         
-        app_config = self.APP_DEFAULTS.get(app_name, {}).copy()
+        app_config = dict(_APP_DEFAULT_CFGS.get(app_name, ()))
         app_config.update(config)
         self._config["applications"][app_name] = app_config
+        self._resolved.pop(app_name, None)
+
+    def set_all_app_configs(self, configs: Dict[str, Dict[str, Any]]) -> None:
+        """Set configurations for several applications in one pass."""
+        applications = self._config.setdefault("applications", {})
+        for app_name, config in configs.items():
+            app_config = dict(_APP_DEFAULT_CFGS.get(app_name, ()))
+            app_config.update(config)
+            applications[app_name] = app_config
+            self._resolved.pop(app_name, None)
 
     def get_app_url(self, app_name: str) -> str:
         """Get full URL for application."""
@@ -117,7 +160,7 @@ class NZBInfoConfig:
         
         protocol = "https" if app_config.get("ssl", False) else "http"
         host = app_config["host"]
-        port = app_config.get("port", self.APP_DEFAULTS.get(app_name, {}).get("port", 80))
+        port = app_config.get("port", _APP_DEFAULT_PORTS.get(app_name, 80))
         url_base = app_config.get("url_base", "").strip("/")
         
         url = f"{protocol}://{host}:{port}"
@@ -126,6 +169,18 @@ class NZBInfoConfig:
         
         return url
 
+    def get_app_request_params(self, app_name: str) -> tuple:
+        """Get cached (base_url, api_key) for an application.
+
+        Resolved once per app and invalidated on config changes, so hot
+        callers avoid the dict merges behind get_app_url/get_app_api_key.
+        """
+        params = self._resolved.get(app_name)
+        if params is None:
+            params = (self.get_app_url(app_name), self.get_app_api_key(app_name))
+            self._resolved[app_name] = params
+        return params
+
     def get_app_api_key(self, app_name: str) -> str:
         """Get API key for application."""
         app_config = self.get_app_config(app_name)
@@ -150,4 +205,13 @@ class NZBInfoConfig:
         return self._config_file
 
 
+# Flattened views of APP_DEFAULTS, computed once at import so hot URL
+# resolution is a single dict lookup instead of nested .get chains.
+_APP_DEFAULT_PORTS: Dict[str, int] = {
+    name: cfg["port"] for name, cfg in NZBInfoConfig.APP_DEFAULTS.items()
+}
+_APP_DEFAULT_CFGS: Dict[str, tuple] = {
+    name: tuple(cfg.items()) for name, cfg in NZBInfoConfig.APP_DEFAULTS.items()
+}
+
 Config = NZBInfoConfig
\ No newline at end of file
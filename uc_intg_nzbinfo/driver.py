@@ -5,13 +5,22 @@ NZB Info Manager Integration Driver.
 :license: MPL-2.0, see LICENSE for more details.
 """
 import asyncio
+import contextlib
 import logging
+import os
+import signal
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
 
 import ucapi
 from ucapi import AbortDriverSetup, DeviceStates, SetupAction, SetupComplete, SetupError
 from ucapi.api_definitions import Events
 
-from uc_intg_nzbinfo.media_player import NZBInfoPlayer
+from uc_intg_nzbinfo.media_player import NZBInfoPlayer, preload_icons
 from uc_intg_nzbinfo.client import NZBInfoClient
 from uc_intg_nzbinfo.config import NZBInfoConfig
 from uc_intg_nzbinfo.setup import NZBInfoSetup
@@ -24,6 +33,8 @@ _client: NZBInfoClient | None = None
 _media_player: NZBInfoPlayer | None = None
 _setup_manager: NZBInfoSetup | None = None
 _monitoring_task: asyncio.Task | None = None
+_monitoring_lock = asyncio.Lock()
+_task_group: asyncio.TaskGroup | None = None
 
 
 async def setup_handler(msg: SetupAction) -> SetupAction:
@@ -59,18 +70,19 @@ async def _initialize_integration():
     global _client, _media_player
     
     # This function now assumes _config and _media_player (the placeholder) already exist.
-    # It just creates the client and links it.
-    _client = NZBInfoClient(_config)
+    # Reuse the existing client (and its pooled session) after a config
+    # change; a fresh instance is only needed on first initialization.
+    if _client is None:
+        _client = NZBInfoClient(_config)
+    else:
+        _client.refresh_enabled_apps()
     
     # Update the existing media player with the new client and config.
     if _media_player:
         _media_player._client = _client
         _media_player._config = _config
         # Re-initialize source list based on new config
-        enabled_apps = _config.get_enabled_apps()
-        source_list = ["System Overview"] + [
-            _media_player.APP_DISPLAY.get(app, {"name": app.title()})["name"] for app in enabled_apps
-        ] if enabled_apps else ["No Applications Configured"]
+        source_list = _media_player.rebuild_source_list()
         _media_player.attributes["source_list"] = source_list
         _media_player.attributes["source"] = source_list[0]
 
@@ -82,11 +94,14 @@ async def _load_existing_configuration() -> bool:
     global _config
     _LOG.info("Attempting to load existing configuration from disk...")
 
-    _config = NZBInfoConfig()
+    if _config is None:
+        _config = NZBInfoConfig()
+    elif await asyncio.to_thread(_config.reload_if_changed):
+        _LOG.info("Configuration file changed on disk; reloaded.")
     enabled_apps = _config.get_enabled_apps()
 
     if enabled_apps:
-        _LOG.info(f"Found existing configuration with {len(enabled_apps)} enabled apps.")
+        _LOG.info("Found existing configuration with %d enabled apps.", len(enabled_apps))
         await _initialize_integration()
         if _client:
             if await _client.connect():
@@ -102,12 +117,21 @@ async def _load_existing_configuration() -> bool:
 
 
 async def start_monitoring_loop():
-    """Start the monitoring task if not already running."""
+    """Start the monitoring task if not already running.
+
+    Serialized with a lock: CONNECT and setup-complete events can fire
+    back to back, and two racing calls would each spawn a task that
+    keeps its own aiohttp session alive.
+    """
     global _monitoring_task
-    if _monitoring_task is None or _monitoring_task.done():
-        if _client and _media_player:
-            _monitoring_task = asyncio.create_task(_media_player.run_monitoring())
-            _LOG.info("NZB Info monitoring task started.")
+    async with _monitoring_lock:
+        if _monitoring_task is None or _monitoring_task.done():
+            if _client and _media_player:
+                if _task_group is not None:
+                    _monitoring_task = _task_group.create_task(_media_player.run_monitoring())
+                else:
+                    _monitoring_task = asyncio.create_task(_media_player.run_monitoring())
+                _LOG.info("NZB Info monitoring task started.")
 
 
 async def on_connect() -> None:
@@ -134,6 +158,8 @@ async def on_disconnect() -> None:
 
     if _monitoring_task:
         _monitoring_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _monitoring_task
         _monitoring_task = None
     if _client and _client.is_connected:
         await _client.disconnect()
@@ -143,17 +169,31 @@ async def on_disconnect() -> None:
 
 async def main():
     """Main integration entry point."""
-    global api, _config, _media_player
+    global api, _config, _media_player, _task_group
     logging.basicConfig(
-        level=logging.INFO,
+        level=os.getenv("UC_LOG_LEVEL", "INFO").upper(),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    _LOG.info(f"Starting NZB Info Manager Integration v{ucapi.__version__}")
+    _LOG.info("Starting NZB Info Manager Integration v%s", ucapi.__version__)
 
     try:
         loop = asyncio.get_running_loop()
         api = ucapi.IntegrationAPI(loop)
 
+        # Cancel the driver task on SIGINT/SIGTERM so the finally block
+        # always closes the HTTP session instead of relying on
+        # KeyboardInterrupt tearing down the loop mid-await.
+        main_task = asyncio.current_task()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, main_task.cancel)
+            except NotImplementedError:
+                # Signal handlers are unavailable on some platforms.
+                break
+
+        # Encode the entity icons off-loop before the player needs them.
+        await preload_icons()
+
         # Create a placeholder configuration and media player entity immediately.
         # This resolves the race condition on initial connection.
         _config = NZBInfoConfig()
@@ -167,13 +207,21 @@ async def main():
         await api.set_device_state(DeviceStates.DISCONNECTED)
 
         _LOG.info("Driver initialized. Waiting for remote connection.")
-        await asyncio.Future()
+
+        # Own the monitoring task through a TaskGroup so cancelling the
+        # driver deterministically cancels and awaits its children.
+        async with asyncio.TaskGroup() as tg:
+            _task_group = tg
+            await asyncio.Future()
 
     except asyncio.CancelledError:
         _LOG.info("Driver task cancelled.")
     finally:
+        _task_group = None
         if _monitoring_task:
             _monitoring_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await _monitoring_task
         if _client:
             await _client.disconnect()
         _LOG.info("NZB Info Manager Integration has stopped.")
@@ -8,6 +8,7 @@ import asyncio
 import base64
 import logging
 import os
+import time
 from typing import Callable
 
 from ucapi import IntegrationAPI, MediaPlayer, StatusCodes, entity
@@ -18,6 +19,55 @@ from uc_intg_nzbinfo.config import NZBInfoConfig
 
 _LOG = logging.getLogger(__name__)
 
+# Attribute-key aliases: one LOAD_GLOBAL instead of an enum member
+# lookup at every reference in the per-tick display builders.
+_ATTR_STATE = Attributes.STATE
+_ATTR_SOURCE = Attributes.SOURCE
+_ATTR_SOURCE_LIST = Attributes.SOURCE_LIST
+_ATTR_TITLE = Attributes.MEDIA_TITLE
+_ATTR_ARTIST = Attributes.MEDIA_ARTIST
+_ATTR_ALBUM = Attributes.MEDIA_ALBUM
+_ATTR_IMAGE = Attributes.MEDIA_IMAGE_URL
+
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+
+
+def _build_icon_cache() -> dict:
+    """Read and base64-encode every bundled icon into data URLs."""
+    urls = {}
+    try:
+        names = os.listdir(_ICON_DIR)
+    except OSError as ex:
+        _LOG.error("Failed to list icon directory %s: %s", _ICON_DIR, ex)
+        return urls
+
+    for name in names:
+        if not name.endswith(".png"):
+            continue
+        try:
+            with open(os.path.join(_ICON_DIR, name), "rb") as f:
+                data = f.read()
+        except OSError as ex:
+            _LOG.error("Failed to read icon %s: %s", name, ex)
+            continue
+        urls[name] = f"data:image/png;base64,{base64.b64encode(data).decode('ascii')}"
+    return urls
+
+
+# Filled by preload_icons() at startup; lookups afterwards do no I/O.
+_ICON_DATA_URLS: dict = {}
+
+
+async def preload_icons() -> None:
+    """Encode the bundled icons in a worker thread before first use.
+
+    Keeps the file reads and base64 encoding off the event loop during
+    driver startup.
+    """
+    if not _ICON_DATA_URLS:
+        _ICON_DATA_URLS.update(await asyncio.to_thread(_build_icon_cache))
+
+
 class NZBInfoPlayer(MediaPlayer):
     """A MediaPlayer entity representing NZB Info applications status with 2-row display."""
 
@@ -32,276 +82,315 @@ class NZBInfoPlayer(MediaPlayer):
         "overseerr": {"name": "Overseerr", "icon": "overseerr.png"}
     }
 
+    # Reverse indexes so source lookups are O(1) instead of scanning APP_DISPLAY.
+    _DISPLAY_TO_APP = {info["name"]: app for app, info in APP_DISPLAY.items()}
+    _SOURCE_TO_ICON = {info["name"]: info["icon"] for info in APP_DISPLAY.values()}
+
     def __init__(self, client: NZBInfoClient, config: NZBInfoConfig, api: IntegrationAPI):
         self._client = client
         self._config = config
         self._api = api
-        self._icon_cache = {}
+        self._last_pushed: dict = {}
+        self._idle_count = 0
+        self._last_update_ts = time.monotonic()
+        self._in_error_state = False
+        self._last_counts = (-1, -1)
+        self._last_overview_title = ""
+        self._pending_refresh: asyncio.Task | None = None
+        self._source_list_key: tuple | None = None
+        self._source_list: list = []
         
         features = [
             Features.ON_OFF,
             Features.SELECT_SOURCE,
         ]
 
-        source_list = []
-        enabled_apps = self._config.get_enabled_apps()
-        
-        if enabled_apps:
-            source_list.append("System Overview")
-        
-        for app_name in enabled_apps:
-            app_info = self.APP_DISPLAY.get(app_name, {"name": app_name.title()})
-            source_list.append(app_info["name"])
-
-        if not source_list:
-            source_list = ["No Applications Configured"]
+        source_list = self.rebuild_source_list()
 
         super().__init__(
             identifier="nzb_info_monitor",
             name="NZB Info Manager",
             features=features,
             attributes={
-                Attributes.STATE: States.ON,
-                Attributes.SOURCE_LIST: source_list,
-                Attributes.SOURCE: source_list[0] if source_list else "Overview",
-                Attributes.MEDIA_TITLE: "Initializing...",
-                Attributes.MEDIA_ARTIST: "Starting up...",
-                Attributes.MEDIA_ALBUM: "Please wait...",
-                Attributes.MEDIA_IMAGE_URL: self._get_icon_base64("system_overview.png"),
+                _ATTR_STATE: States.ON,
+                _ATTR_SOURCE_LIST: source_list,
+                _ATTR_SOURCE: source_list[0] if source_list else "Overview",
+                _ATTR_TITLE: "Initializing...",
+                _ATTR_ARTIST: "Starting up...",
+                _ATTR_ALBUM: "Please wait...",
+                _ATTR_IMAGE: self._get_icon_base64("system_overview.png"),
             },
             cmd_handler=self.handle_command
         )
 
     def _get_icon_base64(self, icon_filename: str) -> str:
-        """Get the base64 encoded icon data."""
-        if icon_filename in self._icon_cache:
-            return self._icon_cache[icon_filename]
+        """Get the base64 encoded icon data from the preloaded cache."""
+        if not _ICON_DATA_URLS:
+            # Fallback if the entity is built before preload_icons() ran.
+            _ICON_DATA_URLS.update(_build_icon_cache())
 
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_dir = os.path.join(script_dir, "icons")
-        icon_path = os.path.join(icon_dir, icon_filename)
-        
-        fallback_icons = ["system_overview.png", "sabnzbd.png"]
-
-        if not os.path.exists(icon_path):
-            _LOG.warning(f"Icon not found: {icon_filename}")
-            for fallback in fallback_icons:
-                icon_path = os.path.join(icon_dir, fallback)
-                if os.path.exists(icon_path):
-                    _LOG.info(f"Using fallback icon: {fallback}")
-                    break
-            else:
-                _LOG.error("No fallback icons found in uc_intg_nzbinfo/icons/ directory")
-                return ""
+        data_url = _ICON_DATA_URLS.get(icon_filename)
+        if data_url is not None:
+            return data_url
 
-        try:
-            with open(icon_path, 'rb') as f:
-                icon_data = f.read()
-                base64_data = base64.b64encode(icon_data).decode('utf-8')
-                data_url = f"data:image/png;base64,{base64_data}"
-                self._icon_cache[icon_filename] = data_url
-                return data_url
-        except Exception as e:
-            _LOG.error(f"Failed to read icon {icon_path}: {e}")
-            return ""
+        _LOG.warning("Icon not found: %s", icon_filename)
+        return _ICON_DATA_URLS.get("system_overview.png", "")
+
+    def rebuild_source_list(self) -> list:
+        """Build the source list for the enabled apps, memoized.
+
+        Both __init__ and the post-setup reload in the driver need the
+        same list; recomputing is skipped while the enabled apps are
+        unchanged.
+        """
+        enabled_apps = tuple(self._config.get_enabled_apps())
+        if enabled_apps == self._source_list_key:
+            return self._source_list
+
+        if enabled_apps:
+            source_list = ["System Overview"] + [
+                self.APP_DISPLAY.get(app, {"name": app.title()})["name"]
+                for app in enabled_apps
+            ]
+        else:
+            source_list = ["No Applications Configured"]
+
+        self._source_list_key = enabled_apps
+        self._source_list = source_list
+        return source_list
 
     def _get_source_image(self, source: str) -> str:
         """Get the proper base64 image data for a given source."""
-        if source == "System Overview":
-            return self._get_icon_base64("system_overview.png")
-        
-        for app_name, app_info in self.APP_DISPLAY.items():
-            if app_info["name"] == source:
-                return self._get_icon_base64(app_info["icon"])
-        
-        return self._get_icon_base64("system_overview.png")
+        return self._get_icon_base64(self._SOURCE_TO_ICON.get(source, "system_overview.png"))
 
     def _get_app_name_from_source(self, source: str) -> str:
         """Get internal app name from display source name."""
-        for app_name, app_info in self.APP_DISPLAY.items():
-            if app_info["name"] == source:
-                return app_name
-        return ""
+        return self._DISPLAY_TO_APP.get(source, "")
 
     async def handle_command(self, entity_arg: entity.Entity, cmd_id: str, params: dict | None) -> StatusCodes:
         """Handle commands for the media player entity."""
-        _LOG.debug(f"NZBInfoPlayer received command: {cmd_id}")
+        _LOG.debug("NZBInfoPlayer received command: %s", cmd_id)
         
         if cmd_id == Commands.OFF:
-            self.attributes[Attributes.STATE] = States.STANDBY
+            self.attributes[_ATTR_STATE] = States.STANDBY
         elif cmd_id == Commands.ON:
-            self.attributes[Attributes.STATE] = States.ON
+            self.attributes[_ATTR_STATE] = States.ON
         elif cmd_id == Commands.SELECT_SOURCE:
             source = params.get("source")
             if source:
-                self.attributes[Attributes.SOURCE] = source
-                self.attributes[Attributes.MEDIA_IMAGE_URL] = self._get_source_image(source)
-                _LOG.info(f"Switched monitoring view to: {source}")
-                
-                await self._force_state_update()
-                
+                source_image = self._get_source_image(source)
+                self.attributes[_ATTR_SOURCE] = source
+                self.attributes[_ATTR_IMAGE] = source_image
+                _LOG.info("Switched monitoring view to: %s", source)
+
+                # Push only the cheap source/image delta now; the full
+                # fan-out fetch happens once via the debounced refresh.
+                self._push_changed({_ATTR_SOURCE: source, _ATTR_IMAGE: source_image})
+                self._schedule_refresh()
+            return StatusCodes.OK
+
         elif cmd_id in [Commands.PLAY_PAUSE, Commands.SHUFFLE, Commands.REPEAT, Commands.STOP, 
                        Commands.NEXT, Commands.PREVIOUS, Commands.VOLUME, Commands.VOLUME_UP, 
                        Commands.VOLUME_DOWN, Commands.MUTE_TOGGLE]:
-            _LOG.debug(f"Ignoring unsupported media command '{cmd_id}' to prevent UI error.")
+            _LOG.debug("Ignoring unsupported media command '%s' to prevent UI error.", cmd_id)
             return StatusCodes.OK
         else:
-            _LOG.warning(f"Unhandled command: {cmd_id}")
+            _LOG.warning("Unhandled command: %s", cmd_id)
             return StatusCodes.NOT_IMPLEMENTED
         
         await self.push_update()
         return StatusCodes.OK
 
+    def _schedule_refresh(self, delay: float = 0.2) -> None:
+        """Debounce full refreshes while the user scrolls through sources.
+
+        Each source change cancels any refresh still waiting, so a burst
+        of clicks ends in a single fan-out fetch instead of one per click.
+        """
+        if self._pending_refresh and not self._pending_refresh.done():
+            self._pending_refresh.cancel()
+        self._pending_refresh = asyncio.create_task(self._delayed_refresh(delay))
+
+    async def _delayed_refresh(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            await self._force_state_update()
+        except asyncio.CancelledError:
+            pass
+
     async def _force_state_update(self):
         """Force an immediate state update after source change."""
         try:
-            await self._client.update_all_statuses()
-            
-            current_source = self.attributes.get(Attributes.SOURCE, "System Overview")
-            
-            fresh_attrs = {
-                Attributes.STATE: States.ON,
-                Attributes.SOURCE_LIST: self.attributes[Attributes.SOURCE_LIST],
-                Attributes.SOURCE: current_source,
-            }
-            
-            if current_source == "System Overview":
-                await self._update_overview_display(fresh_attrs)
-            else:
-                await self._update_app_display_2row(current_source, fresh_attrs)
-            
-            self.attributes.update(fresh_attrs)
-            
-            if self._api.configured_entities.contains(self.id):
-                self._api.configured_entities.update_attributes(self.id, fresh_attrs)
-                
+            await self.push_update()
         except Exception as e:
-            _LOG.error(f"Error in force state update: {e}")
+            _LOG.error("Error in force state update: %s", e)
 
     async def run_monitoring(self):
-        """Periodically fetch data and update the entity."""
+        """Periodically fetch data and update the entity.
+
+        The interval adapts to activity: 5s while anything is
+        downloading, backing off towards 60s when every app is idle.
+        Repeated errors back off exponentially up to five minutes and
+        are logged only on the failure/recovery transitions.
+        """
+        backoff = 1.0
+        failing = False
         while True:
             try:
                 await self.push_update()
-                await asyncio.sleep(10)
+                if failing:
+                    _LOG.info("Monitoring loop recovered")
+                    failing = False
+                backoff = 1.0
+                await asyncio.sleep(self._next_poll_interval())
             except asyncio.CancelledError:
                 _LOG.info("Monitoring task cancelled")
                 break
             except Exception as e:
-                _LOG.error(f"Error in monitoring loop: {e}", exc_info=True)
-                await asyncio.sleep(30)
+                if not failing:
+                    _LOG.error("Error in monitoring loop: %s", e, exc_info=True)
+                    failing = True
+                await asyncio.sleep(min(300.0, 10.0 * backoff))
+                backoff *= 2
+
+    def _next_poll_interval(self) -> float:
+        """Pick the next monitoring sleep based on download activity."""
+        active = False
+        if self._client:
+            for status in self._client.get_all_statuses().values():
+                if status.is_online and "downloading" in status.primary_info.lower():
+                    active = True
+                    break
+
+        if active:
+            self._idle_count = 0
+            return 5.0
+
+        self._idle_count += 1
+        return min(60.0, 10.0 * self._idle_count)
 
     async def push_update(self):
         """Fetches the latest data and pushes it to the API."""
+        attrs = self.attributes
         if not self._api.configured_entities.contains(self.id):
             return
 
-        if not await self._client.update_all_statuses():
-            error_attrs = {
-                Attributes.STATE: States.OFF,
-                Attributes.MEDIA_TITLE: "Connection Error", 
-                Attributes.MEDIA_ARTIST: "Unable to reach applications",
-                Attributes.MEDIA_ALBUM: "Check configuration",
-                Attributes.MEDIA_IMAGE_URL: self._get_icon_base64("system_overview.png")
-            }
-            self.attributes.update(error_attrs)
-            self._api.configured_entities.update_attributes(self.id, error_attrs)
-            return
+        # Start the network fetch first so the attribute skeleton is
+        # prepared while the status requests are in flight.
+        fetch = asyncio.create_task(self._client.update_all_statuses())
 
-        current_source = self.attributes.get(Attributes.SOURCE, "System Overview")
+        current_source = attrs.get(_ATTR_SOURCE, "System Overview")
         
         attrs_to_update = {
-            Attributes.STATE: States.ON,
-            Attributes.SOURCE_LIST: self.attributes[Attributes.SOURCE_LIST],
-            Attributes.SOURCE: current_source,
+            _ATTR_STATE: States.ON,
+            _ATTR_SOURCE_LIST: attrs[_ATTR_SOURCE_LIST],
+            _ATTR_SOURCE: current_source,
         }
-        
+
+        if not await fetch:
+            if self._in_error_state:
+                # The error payload was already pushed; don't rebuild and
+                # re-send it every tick for the duration of the outage.
+                return
+            self._in_error_state = True
+            error_attrs = {
+                _ATTR_STATE: States.OFF,
+                _ATTR_TITLE: "Connection Error", 
+                _ATTR_ARTIST: "Unable to reach applications",
+                _ATTR_ALBUM: "Check configuration",
+                _ATTR_IMAGE: self._get_icon_base64("system_overview.png")
+            }
+            attrs.update(error_attrs)
+            self._push_changed(error_attrs)
+            return
+        self._in_error_state = False
+        # Stamp before the builders run so the overview's "Last updated"
+        # line reflects this refresh, not the previous one.
+        self._last_update_ts = time.monotonic()
+
         if current_source == "System Overview":
             await self._update_overview_display(attrs_to_update)
         else:
             await self._update_app_display_2row(current_source, attrs_to_update)
-        
-        self.attributes.update(attrs_to_update)
-        self._api.configured_entities.update_attributes(self.id, attrs_to_update)
-        
-        _LOG.debug(f"Pushed display update for source: {current_source}")
+
+        attrs.update(attrs_to_update)
+        if self._push_changed(attrs_to_update):
+            _LOG.debug("Pushed display update for source: %s", current_source)
+
+    def _push_changed(self, attrs: dict) -> bool:
+        """Push only the attributes that differ from the last update.
+
+        Identical monitoring ticks would otherwise re-send the full
+        payload (including the base64 icon) over the websocket every
+        10 seconds.
+        """
+        delta = {k: v for k, v in attrs.items() if self._last_pushed.get(k) != v}
+        if not delta:
+            return False
+
+        self._api.configured_entities.update_attributes(self.id, delta)
+        self._last_pushed.update(delta)
+        return True
 
     async def _update_overview_display(self, attrs_to_update: dict):
         """Update display for system overview."""
         statuses = self._client.get_all_statuses()
         
         if not statuses:
-            attrs_to_update.update({
-                Attributes.MEDIA_TITLE: "No Applications",
-                Attributes.MEDIA_ARTIST: "No apps configured",
-                Attributes.MEDIA_ALBUM: "Add apps in setup",
-                Attributes.MEDIA_IMAGE_URL: self._get_icon_base64("system_overview.png")
-            })
+            attrs_to_update[_ATTR_TITLE] = "No Applications"
+            attrs_to_update[_ATTR_ARTIST] = "No apps configured"
+            attrs_to_update[_ATTR_ALBUM] = "Add apps in setup"
+            attrs_to_update[_ATTR_IMAGE] = self._get_icon_base64("system_overview.png")
             return
         
         online_count = sum(1 for status in statuses.values() if status.is_online)
         total_count = len(statuses)
+
+        if (online_count, total_count) != self._last_counts:
+            self._last_counts = (online_count, total_count)
+            self._last_overview_title = f"NZB Info Manager ({online_count}/{total_count} online)"
         
         priority_info = "All applications monitored"
-        for app_name in ["sabnzbd", "nzbget", "sonarr", "radarr", "lidarr", "readarr"]:
-            if app_name in statuses:
-                status = statuses[app_name]
-                if status.is_online and "downloading" in status.primary_info.lower():
-                    priority_info = f"{status.title}: {status.primary_info}"
-                    break
-                elif status.is_online and "queue" in status.primary_info.lower() and "idle" not in status.primary_info.lower():
-                    priority_info = f"{status.title}: {status.primary_info}"
-                    break
+        for app_name in ("sabnzbd", "nzbget", "sonarr", "radarr", "lidarr", "readarr"):
+            status = statuses.get(app_name)
+            if not status or not status.is_online:
+                continue
+            pi = status.primary_info.lower()
+            if "downloading" in pi or ("queue" in pi and "idle" not in pi):
+                priority_info = f"{status.title}: {status.primary_info}"
+                break
         
-        attrs_to_update.update({
-            Attributes.MEDIA_TITLE: f"NZB Info Manager ({online_count}/{total_count} online)",
-            Attributes.MEDIA_ARTIST: priority_info,
-            Attributes.MEDIA_ALBUM: f"Last updated: {self._format_time_ago()}",
-            Attributes.MEDIA_IMAGE_URL: self._get_icon_base64("system_overview.png")
-        })
+        attrs_to_update[_ATTR_TITLE] = self._last_overview_title
+        attrs_to_update[_ATTR_ARTIST] = priority_info
+        attrs_to_update[_ATTR_ALBUM] = f"Last updated: {self._format_time_ago()}"
+        attrs_to_update[_ATTR_IMAGE] = self._get_icon_base64("system_overview.png")
 
     async def _update_app_display_2row(self, source: str, attrs_to_update: dict):
         """Update display for specific application with 2-row format."""
         app_name = self._get_app_name_from_source(source)
         if not app_name:
-            attrs_to_update.update({
-                Attributes.MEDIA_TITLE: "Application not found",
-                Attributes.MEDIA_ARTIST: "Check configuration", 
-                Attributes.MEDIA_ALBUM: "",
-                Attributes.MEDIA_IMAGE_URL: self._get_source_image(source)
-            })
-            return
-        
-        status = self._client.get_app_status(app_name)
-        if not status:
-            attrs_to_update.update({
-                Attributes.MEDIA_TITLE: "Status unavailable",
-                Attributes.MEDIA_ARTIST: "Application not configured",
-                Attributes.MEDIA_ALBUM: "",
-                Attributes.MEDIA_IMAGE_URL: self._get_source_image(source)
-            })
-            return
-        
-        if not status.is_online:
-            row1_value = "Connection Error"
-            row2_value = f"Check {status.title} configuration"
+            row1_value = "Application not found"
+            row2_value = "Check configuration"
         else:
-            row1_value = status.primary_info
-            row2_value = status.secondary_info
+            status = self._client.get_app_status(app_name)
+            if not status:
+                row1_value = "Status unavailable"
+                row2_value = "Application not configured"
+            elif not status.is_online:
+                row1_value = "Connection Error"
+                row2_value = f"Check {status.title} configuration"
+            else:
+                row1_value = status.primary_info
+                row2_value = status.secondary_info
         
-        attrs_to_update.update({
-            Attributes.MEDIA_TITLE: row1_value,
-            Attributes.MEDIA_ARTIST: row2_value,
-            Attributes.MEDIA_ALBUM: "",
-            Attributes.MEDIA_IMAGE_URL: self._get_source_image(source)
-        })
+        attrs_to_update[_ATTR_TITLE] = row1_value
+        attrs_to_update[_ATTR_ARTIST] = row2_value
+        attrs_to_update[_ATTR_ALBUM] = ""
+        attrs_to_update[_ATTR_IMAGE] = self._get_source_image(source)
 
     def _format_time_ago(self) -> str:
-        """Format time ago string."""
-        import time
-        
-        now = time.time()
-        diff = max(0, now - (now - 5))
+        """Format the time since the last successful update."""
+        diff = max(0.0, time.monotonic() - self._last_update_ts)
         
         if diff < 60:
             return "just now"
@@ -8,10 +8,17 @@ Setup flow for NZB Info Manager Integration.
 import asyncio
 import logging
 import ssl
+from functools import lru_cache
+from urllib.parse import urlsplit
 from typing import Any, Dict, List
 
 import aiohttp
-import certifi
+
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
 from ucapi import (
     AbortDriverSetup,
     DriverSetupRequest,
@@ -27,6 +34,28 @@ from uc_intg_nzbinfo.config import NZBInfoConfig
 
 _LOG = logging.getLogger(__name__)
 
+# A 401 still proves the service is reachable; the key is fixed later.
+_OK_STATUSES = frozenset({200, 401})
+
+# Values the remote may send for an enabled toggle (True == 1 in Python,
+# so the set also covers integer 1).
+_TRUTHY = frozenset({"true", "1", True})
+
+
+@lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Build the relaxed probe SSL context once and reuse it.
+
+    certifi is imported here rather than at module load so HTTP-only
+    setups never pay for locating the CA bundle.
+    """
+    import certifi
+
+    ctx = ssl.create_default_context(cafile=certifi.where())
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
 
 class NZBInfoSetup:
     """Setup flow handler for NZB Info integration."""
@@ -42,6 +71,35 @@ class NZBInfoSetup:
         "overseerr": {"name": "Overseerr", "port": 5055, "description": "Request Manager"}
     }
 
+    # Static probe tables: endpoint per app, which header carries the
+    # API key, and which apps are probed with a JSON-RPC POST.
+    _TEST_ENDPOINTS = {
+        "sabnzbd": "/api?mode=version",
+        "nzbget": "/jsonrpc",
+        "sonarr": "/api/v3/system/status",
+        "radarr": "/api/v3/system/status",
+        "lidarr": "/api/v1/system/status",
+        "readarr": "/api/v1/system/status",
+        "bazarr": "/api/system/status",
+        "overseerr": "/api/v1/status"
+    }
+    _API_KEY_HEADERS = {
+        "bazarr": "X-API-KEY",
+        "sonarr": "X-Api-Key",
+        "radarr": "X-Api-Key",
+        "lidarr": "X-Api-Key",
+        "readarr": "X-Api-Key",
+        "overseerr": "X-Api-Key",
+    }
+    _POST_PROBE_APPS = frozenset({"nzbget"})
+
+    _SUMMARY_HEAD = ("🎬 NZB Info Manager Setup Summary\\n",)
+    _SUMMARY_TAIL = (
+        "",
+        "📝 Configuration will be saved and entities created.",
+        "⚠️ Apps with connection issues will still be configured - you can fix them later."
+    )
+
     def __init__(self, config: NZBInfoConfig, api):
         """Initialize setup handler."""
         self._config = config
@@ -67,30 +125,24 @@ class NZBInfoSetup:
 
     def _parse_host_port_ssl(self, host_port: str, default_port: int) -> Dict[str, Any]:
         """Parse host:port string and detect SSL."""
-        use_ssl = False
-        clean_host_port = host_port.strip()
-
-        if clean_host_port.startswith("https://"):
-            use_ssl = True
-            clean_host_port = clean_host_port[8:]
-        elif clean_host_port.startswith("http://"):
-            use_ssl = False
-            clean_host_port = clean_host_port[7:]
-
-        if ":" in clean_host_port:
-            host, port_str = clean_host_port.rsplit(":", 1)
-            try:
-                port = int(port_str)
-            except ValueError:
-                port = default_port
-        else:
-            host = clean_host_port
+        target = host_port.strip()
+        if "://" not in target:
+            target = f"http://{target}"
+
+        try:
+            parts = urlsplit(target)
+            host = parts.hostname or ""
+            port = parts.port or default_port
+        except ValueError:
+            # Invalid port or malformed netloc; fall back to defaults.
+            host = target.split("://", 1)[-1].split(":", 1)[0]
             port = default_port
+            parts = None
 
         return {
-            "host": host.strip(),
+            "host": host,
             "port": port,
-            "ssl": use_ssl
+            "ssl": parts.scheme == "https" if parts else target.startswith("https://")
         }
 
     async def _handle_driver_setup_request(self, request: DriverSetupRequest) -> SetupAction:
@@ -100,44 +152,83 @@ class NZBInfoSetup:
         enabled_apps = []
         app_configs = {}
 
-        _LOG.info(f"Raw setup_data received: {request.setup_data}")
+        _LOG.info("Raw setup_data received: %s", request.setup_data)
 
-        for app_name in self.APP_INFO.keys():
-            enabled_key = f"{app_name}_enabled"
-            host_key = f"{app_name}_host"
-            api_key = f"{app_name}_api"
+        setup_data = request.setup_data
+        for key, is_enabled in setup_data.items():
+            if not key.endswith("_enabled") or is_enabled not in _TRUTHY:
+                continue
 
-            is_enabled = request.setup_data.get(enabled_key, "false")
-            if is_enabled == "true" or is_enabled is True:
-                host_port = request.setup_data.get(host_key, "")
-                api_value = request.setup_data.get(api_key, "")
+            app_name = key[: -len("_enabled")]
+            if app_name not in self.APP_INFO:
+                continue
 
-                if host_port.strip():
-                    enabled_apps.append(app_name)
+            host_port = setup_data.get(f"{app_name}_host", "")
+            api_value = setup_data.get(f"{app_name}_api", "")
 
-                    parsed = self._parse_host_port_ssl(host_port, self.APP_INFO[app_name]["port"])
+            if host_port.strip():
+                enabled_apps.append(app_name)
 
-                    app_configs[app_name] = {
-                        "host": parsed["host"],
-                        "port": parsed["port"],
-                        "api_key": api_value.strip(),
-                        "ssl": parsed["ssl"],
-                        "url_base": ""
-                    }
+                parsed = self._parse_host_port_ssl(host_port, self.APP_INFO[app_name]["port"])
 
-                    protocol = "https" if parsed["ssl"] else "http"
-                    _LOG.info(f"Configured {app_name}: {protocol}://{parsed['host']}:{parsed['port']} with API key: {'***' if api_value else 'empty'}")
+                app_configs[app_name] = {
+                    "host": parsed["host"],
+                    "port": parsed["port"],
+                    "api_key": api_value.strip(),
+                    "ssl": parsed["ssl"],
+                    "url_base": ""
+                }
+
+                protocol = "https" if parsed["ssl"] else "http"
+                _LOG.info("Configured %s: %s://%s:%s with API key: %s", app_name, protocol, parsed["host"], parsed["port"], "***" if api_value else "empty")
 
         if not enabled_apps:
             _LOG.error("No applications configured properly")
             return SetupError(IntegrationSetupError.OTHER)
 
+        # One pooled session for all probes so they share connections
+        # instead of paying a fresh handshake each. The relaxed SSL
+        # context is only attached when some target actually uses HTTPS;
+        # all-HTTP setups skip the context entirely.
+        connector_args = {
+            "limit": 32,
+            "limit_per_host": 4,
+            "keepalive_timeout": 30,
+            "enable_cleanup_closed": True,
+            "use_dns_cache": True,
+            "ttl_dns_cache": 300,
+            "resolver": aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+        }
+        if any(app_configs[name].get("ssl") for name in enabled_apps):
+            connector_args["ssl"] = _get_ssl_context()
+        connector = aiohttp.TCPConnector(**connector_args)
+
+        # Bound the fan-out so a large app list cannot exhaust sockets.
+        sem = asyncio.Semaphore(8)
+
+        async def guarded_probe(name: str) -> Dict[str, Any]:
+            async with sem:
+                return await self._test_app_connection(name, app_configs[name], session)
+
+        # Fail fast on dead hosts: a tight connect cap keeps one
+        # misconfigured address from stalling the whole setup.
+        timeout = aiohttp.ClientTimeout(total=8, connect=3, sock_connect=3, sock_read=5)
+
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector
+        ) as session:
+            results = await asyncio.gather(
+                *(guarded_probe(name) for name in enabled_apps),
+                return_exceptions=True,
+            )
+
         connection_results = {}
-        for app_name in enabled_apps:
-            config = app_configs[app_name]
-            test_result = await self._test_app_connection(app_name, config)
-            connection_results[app_name] = test_result
-            _LOG.info(f"Connection test for {app_name}: {test_result}")
+        for app_name, result in zip(enabled_apps, results):
+            if isinstance(result, BaseException):
+                result = {"success": False, "error": f"Connection error: {str(result)[:50]}"}
+            connection_results[app_name] = result
+            _LOG.info("Connection test for %s: %s", app_name, result)
 
         return await self._show_setup_summary(enabled_apps, app_configs, connection_results)
 
@@ -148,83 +239,80 @@ class NZBInfoSetup:
         else:
             return AbortDriverSetup(IntegrationSetupError.OTHER)
 
-    async def _test_app_connection(self, app_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Test connection to application with proper SSL handling."""
+    async def _test_app_connection(
+        self, app_name: str, config: Dict[str, Any], session: aiohttp.ClientSession
+    ) -> Dict[str, Any]:
+        """Test connection to application using the shared probe session."""
+        host = config.get("host", "")
+        if not host:
+            return {"success": False, "error": "No host configured"}
+
         try:
             protocol = "https" if config.get("ssl", False) else "http"
-            host = config.get("host", "")
             port = config.get("port", self.APP_INFO[app_name]["port"])
             url_base = config.get("url_base", "").strip("/")
 
-            base_url = f"{protocol}://{host}:{port}"
-            if url_base:
-                base_url += f"/{url_base}"
-
-            test_endpoints = {
-                "sabnzbd": "/api?mode=version",
-                "nzbget": "/jsonrpc",
-                "sonarr": "/api/v3/system/status",
-                "radarr": "/api/v3/system/status",
-                "lidarr": "/api/v1/system/status",
-                "readarr": "/api/v1/system/status",
-                "bazarr": "/api/system/status",
-                "overseerr": "/api/v1/status"
-            }
-
-            endpoint = test_endpoints.get(app_name, "/")
-            test_url = f"{base_url}{endpoint}"
-
-            headers = {}
+            # Cheap socket pre-check: a dead host fails in 1.5s here
+            # instead of holding an HTTP probe slot for the full timeout.
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), 1.5
+                )
+                writer.close()
+                await writer.wait_closed()
+            except asyncio.TimeoutError:
+                return {"success": False, "error": f"Connection timeout to {host}:{port}"}
+            except OSError:
+                return {"success": False, "error": f"Connection refused at {host}:{port}"}
+
+            endpoint = self._TEST_ENDPOINTS.get(app_name, "/")
+            test_url = "".join((
+                protocol, "://", host, ":", str(port),
+                f"/{url_base}" if url_base else "",
+                endpoint,
+            ))
+
+            headers = None
             api_key = config.get("api_key", "")
 
             if api_key:
                 if app_name == "sabnzbd":
                     separator = "&" if "?" in test_url else "?"
                     test_url += f"{separator}apikey={api_key}"
-                elif app_name == "bazarr":
-                    headers["X-API-KEY"] = api_key
-                elif app_name in ["sonarr", "radarr", "lidarr", "readarr", "overseerr"]:
-                    headers["X-Api-Key"] = api_key
-
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-            timeout = aiohttp.ClientTimeout(total=15)
-
-            async with aiohttp.ClientSession(
-                timeout=timeout,
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            ) as session:
-                _LOG.debug(f"Testing {app_name} at {test_url}")
-
-                if app_name == "nzbget":
-                    payload = {"method": "version", "params": [], "id": 1}
-                    async with session.post(test_url, json=payload, headers=headers) as response:
-                        _LOG.debug(f"{app_name} response: HTTP {response.status}")
-                        if response.status in [200, 401]:
-                            return {"success": True, "status": response.status}
-                        else:
-                            return {"success": False, "error": f"HTTP {response.status}"}
                 else:
-                    async with session.get(test_url, headers=headers) as response:
-                        _LOG.debug(f"{app_name} response: HTTP {response.status}")
-                        if response.status in [200, 401]:
-                            return {"success": True, "status": response.status}
-                        else:
-                            return {"success": False, "error": f"HTTP {response.status}"}
+                    header_name = self._API_KEY_HEADERS.get(app_name)
+                    if header_name:
+                        headers = {header_name: api_key}
+
+            _LOG.debug("Testing %s at %s", app_name, test_url)
+
+            if app_name in self._POST_PROBE_APPS:
+                payload = {"method": "version", "params": [], "id": 1}
+                async with session.post(test_url, json=payload, headers=headers) as response:
+                    _LOG.debug("%s response: HTTP %s", app_name, response.status)
+                    if response.status in _OK_STATUSES:
+                        return {"success": True, "status": response.status}
+                    else:
+                        return {"success": False, "error": f"HTTP {response.status}"}
+            else:
+                async with session.get(test_url, headers=headers) as response:
+                    _LOG.debug("%s response: HTTP %s", app_name, response.status)
+                    if response.status in _OK_STATUSES:
+                        return {"success": True, "status": response.status}
+                    else:
+                        return {"success": False, "error": f"HTTP {response.status}"}
 
         except aiohttp.ClientConnectorError as e:
             error_msg = f"Connection refused at {host}:{port}"
-            _LOG.debug(f"{app_name} connection error: {e}")
+            _LOG.debug("%s connection error: %s", app_name, e)
             return {"success": False, "error": error_msg}
         except asyncio.TimeoutError:
             error_msg = f"Connection timeout to {host}:{port}"
-            _LOG.debug(f"{app_name} timeout error")
+            _LOG.debug("%s timeout error", app_name)
             return {"success": False, "error": error_msg}
         except Exception as ex:
             error_msg = f"Connection error: {str(ex)[:50]}"
-            _LOG.debug(f"{app_name} general error: {ex}")
+            _LOG.debug("%s general error: %s", app_name, ex)
             return {"success": False, "error": error_msg}
 
     async def _show_setup_summary(self, enabled_apps: List[str], app_configs: Dict[str, Dict[str, Any]], connection_results: Dict[str, Dict[str, Any]]) -> RequestUserConfirmation:
@@ -232,7 +320,7 @@ class NZBInfoSetup:
         self._enabled_apps = enabled_apps
         self._app_configs = app_configs
 
-        summary_lines = ["🎬 NZB Info Manager Setup Summary\\n"]
+        summary_lines = list(self._SUMMARY_HEAD)
 
         for app_name in enabled_apps:
             app_info = self.APP_INFO[app_name]
@@ -249,11 +337,7 @@ class NZBInfoSetup:
                 error = result.get("error", "Unknown error")
                 summary_lines.append(f"⚠️ {app_info['name']}: {protocol}://{host}:{port} - {error}")
 
-        summary_lines.extend([
-            "",
-            "📝 Configuration will be saved and entities created.",
-            "⚠️ Apps with connection issues will still be configured - you can fix them later."
-        ])
+        summary_lines.extend(self._SUMMARY_TAIL)
 
         return RequestUserConfirmation(
             title={"en": "Confirm NZB Info Setup"},
@@ -265,15 +349,13 @@ class NZBInfoSetup:
         """Save configuration and complete setup."""
         try:
             self._config.set_enabled_apps(self._enabled_apps)
-
-            for app_name, config in self._app_configs.items():
-                self._config.set_app_config(app_name, config)
+            self._config.set_all_app_configs(self._app_configs)
 
             if not self._config.save_config():
                 _LOG.error("Failed to save configuration")
                 return SetupError(IntegrationSetupError.OTHER)
 
-            _LOG.info(f"Configuration saved successfully for {len(self._enabled_apps)} applications")
+            _LOG.info("Configuration saved successfully for %d applications", len(self._enabled_apps))
             return SetupComplete()
 
         except Exception as ex: